@@ -64,56 +64,132 @@ To kill the process, get the PID and use the following command:
 
 .. code-block:: bash
 
-    $ kill -9 <PID>
+    $ kill <PID>
+
+This stops the script cleanly, closing the browser. To force an update check
+right away instead of waiting for the next scheduled one:
+
+.. code-block:: bash
+
+    $ kill -USR1 <PID>
 
 Functions
 ---------
+Config
+    Holds the settings from the config files, validated once at startup.
+setup_session()
+    Set up the persistent HTTP session used for the lightweight check.
+http_login(session)
+    Logs in to the IRCC portal over plain HTTP.
+fetch_dashboard(session)
+    Fetches the dashboard page with the session's current cookies.
+copy_cookies_to_session(driver, session)
+    Copies the WebDriver's cookies into the HTTP session.
+check_for_updates_http(session, now=None, pool=None)
+    Checks for updates on the IRCC portal without a browser.
 setup_webdriver()
-    Set up the Selenium WebDriver and return it as a context manager.
+    Set up the Selenium WebDriver.
+DriverPool
+    Holds a single long-lived WebDriver and recreates it only when needed.
 login(driver, wait)
     Logs in to the IRCC portal.
-check_for_updates(driver, wait)
+check_for_updates(driver, wait, now=None, reload=False)
     Checks for updates on the IRCC portal.
+handle_updated_date(updated_date, driver=None, now=None, pool=None)
+    Compares the scraped date to the stored one and notifies.
+heartbeat_due(now=None)
+    Returns whether the daily "no update" heartbeat email should be sent.
+parse_updated_date(text)
+    Parses an "Updated" date into an epoch timestamp.
+read_state()
+    Returns the saved state, reading it from disk only once.
+update_state(**changes)
+    Atomically writes changed state values.
+read_last_updated()
+    Returns the last updated timestamp.
+write_last_updated(updated_ts, found_at=None, text=None)
+    Saves the last updated timestamp and when the update was found.
+dashboard_unchanged(session)
+    Checks with a conditional HEAD request whether the dashboard changed.
 take_screenshot(driver, update=False)
     Takes a screenshot of the IRCC portal.
-send_notification(updated_date, update, screenshot_path)
+send_notification(updated_date, update, screenshot_path, now=None)
     Sends a notification via email and/or push.
+MailClient
+    Keeps a single authenticated SMTP connection open across emails.
 send_email(subject, body, screenshot_path=None)
     Sends an email notification.
 send_push_notification(title, message)
     Sends a push notification.
+check_job(session, pool)
+    Runs a single update check.
+next_check_interval(interval, update)
+    Returns the number of seconds to wait before the next check.
+update_density(when, history)
+    Returns how likely an update is at a time of day, relative to uniform.
+next_check_delay(interval, now=None)
+    Places the next check according to the times of past updates.
 main()
-    The main function; runs the script.
+    The main function; schedules `check_job` and runs the script.
 
 Notes
 -----
+Each check first tries to read the dashboard over plain HTTP with a
+persistent `requests.Session`. Selenium is only used as a fallback when the
+HTTP login form can't be read, the HTTP login is blocked, or the "Updated"
+field can't be found in the returned HTML.
+
 This script uses Selenium to automate a web browser. The script uses the 
 Safari WebDriver, but you can use any WebDriver. Download the WebDriver for 
 your browser here: https://www.selenium.dev/downloads/
 
 """
 
+import atexit
+import base64
+import collections
+import concurrent.futures
+import dataclasses
 import datetime
+import functools
+import gc
+import hashlib
+import html
 import json
 import logging
+import math
+import operator
 import os
+import re
+import signal
 import smtplib
-import sys
+import subprocess
+import threading
 import time
 import traceback
-from contextlib import contextmanager
 from email.mime.image import MIMEImage
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
+from urllib.parse import urljoin
 
 import requests
+import urllib3
+from apscheduler.events import (
+    EVENT_JOB_ERROR,
+    EVENT_JOB_EXECUTED,
+    EVENT_JOB_MAX_INSTANCES,
+)
+from apscheduler.schedulers.blocking import BlockingScheduler
+from requests.adapters import HTTPAdapter
 from selenium import webdriver
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.remote.remote_connection import RemoteConnection
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.wait import WebDriverWait
+from urllib3.util.retry import Retry
 
 from purge_screenshots import purge_old_screenshots as pshots
 
@@ -122,40 +198,112 @@ from purge_screenshots import purge_old_screenshots as pshots
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s %(levelname)s %(message)s",
-    handlers=[logging.FileHandler("output.log"), logging.StreamHandler()],
+    handlers=[logging.FileHandler("output.log", delay=True), logging.StreamHandler()],
 )
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Config:
+    """Settings from the PRIVATE and PUBLIC config files.
+
+    The config files are read and validated once at startup, so a missing
+    or mistyped setting fails immediately instead of in the middle of a check.
+
+    Methods
+    -------
+    from_files(*paths)
+        Load and validate the settings from the given JSON config files.
+    """
+
+    # PRIVATE settings that should not be shared with others.
+    USERNAME_IRCC: str
+    PASSWORD_IRCC: str
+    EMAIL_ADDRESS: str
+    EMAIL_PASSWORD: str
+    EMAIL_SERVER: str
+    EMAIL_PORT: int
+    # PUBLIC settings; more general/less sensitive.
+    LOGIN_URL: str
+    DASHBOARD_URL: str
+    LAST_UPDATED_FILE: str  # File to store last updated date
+    SCREENSHOTS_DIR: str  # Dir to store screenshots
+    # Optional PRIVATE settings.
+    PUSH_USER: str = ""
+    PUSH_TOKEN: str = ""
+
+    @classmethod
+    def from_files(cls, *paths):
+        """Load and validate the settings from the given JSON config files.
+
+        Parameters
+        ----------
+        *paths : str
+            The paths to the config files. Later files override earlier ones.
+
+        Returns
+        -------
+        config : Config
+            The validated settings.
+
+        Raises
+        ------
+        KeyError
+            If a required setting is missing.
+        TypeError
+            If a setting has the wrong type.
+        """
+        settings = {}
+        for path in paths:
+            with open(path) as f:
+                settings.update(json.load(f))
+
+        missing = [
+            field.name
+            for field in dataclasses.fields(cls)
+            if field.default is dataclasses.MISSING and field.name not in settings
+        ]
+        if missing:
+            raise KeyError("Missing settings in the config files: " + ", ".join(missing))
+
+        values = {}
+        for field in dataclasses.fields(cls):
+            if field.name not in settings:
+                continue
+            value = settings[field.name]
+            if not isinstance(value, field.type):
+                raise TypeError(
+                    f"Config setting {field.name} should be a {field.type.__name__}, "
+                    f"not {type(value).__name__}"
+                )
+            values[field.name] = value
+
+        return cls(**values)
 
-# Open the PRIVATE config file and load its contents into a dictionary
-with open("config_private.json") as f:
-    private_config = json.load(f)
 
-# Open the PUBLIC config file and load its contents into a dictionary
-with open("config_public.json") as f:
-    public_config = json.load(f)
+CONFIG = Config.from_files("config_private.json", "config_public.json")
 
 #
 # Set the configuration settings from the PRIVATE config file.
 # These are private settings that should not be shared with others.
 #
-USERNAME_IRCC = private_config["USERNAME_IRCC"]
-PASSWORD_IRCC = private_config["PASSWORD_IRCC"]
-EMAIL_ADDRESS = private_config["EMAIL_ADDRESS"]
-EMAIL_PASSWORD = private_config["EMAIL_PASSWORD"]
-EMAIL_SERVER = private_config["EMAIL_SERVER"]
-EMAIL_PORT = private_config["EMAIL_PORT"]
-PUSH_USER = private_config["PUSH_USER"]  # Optional
-PUSH_TOKEN = private_config["PUSH_TOKEN"]  # Optional
+USERNAME_IRCC = CONFIG.USERNAME_IRCC
+PASSWORD_IRCC = CONFIG.PASSWORD_IRCC
+EMAIL_ADDRESS = CONFIG.EMAIL_ADDRESS
+EMAIL_PASSWORD = CONFIG.EMAIL_PASSWORD
+EMAIL_SERVER = CONFIG.EMAIL_SERVER
+EMAIL_PORT = CONFIG.EMAIL_PORT
+PUSH_USER = CONFIG.PUSH_USER  # Optional
+PUSH_TOKEN = CONFIG.PUSH_TOKEN  # Optional
 
 #
 # Set the configuration settings from the PUBLIC config file.
 # These are more general/less sensitive settings.
 #
-LOGIN_URL = public_config["LOGIN_URL"]
-DASHBOARD_URL = public_config["DASHBOARD_URL"]
-LAST_UPDATED_FILE = public_config[
-    "LAST_UPDATED_FILE"
-]  # File to store last updated date
-SCREENSHOTS_DIR = public_config["SCREENSHOTS_DIR"]  # Dir to store screenshots
+LOGIN_URL = CONFIG.LOGIN_URL
+DASHBOARD_URL = CONFIG.DASHBOARD_URL
+LAST_UPDATED_FILE = CONFIG.LAST_UPDATED_FILE  # File to store last updated date
+SCREENSHOTS_DIR = CONFIG.SCREENSHOTS_DIR  # Dir to store screenshots
 
 #
 # Set the configuration settings that are not in the config files.
@@ -165,22 +313,503 @@ CHECK_INTERVAL_HOURS = 3  # 3 hr
 CHECK_INTERVAL_SECONDS = (
     CHECK_INTERVAL_HOURS * 60 * 60
 )  # num_hrs * 60 min/hr * 60 sec/min
-# Do you want the driver to be reinitialized only periodically or after every check? If the latter, set this to True:
-REINIT_DRIVER_EVERYTIME = True
-# If the driver is to be reinitialized only intermittently, set the interval at which it will be reinitialized:
-REINITIALIZATION_INTERVAL = None
-if not REINIT_DRIVER_EVERYTIME:
-    REINITIALIZATION_INTERVAL = CHECK_INTERVAL_SECONDS / 2
+# The interval adapts between these bounds: it's halved after an update (updates tend to come in clusters) and slowly stretched again while nothing changes:
+MIN_CHECK_INTERVAL_SECONDS = 15 * 60  # 15 min
+MAX_CHECK_INTERVAL_SECONDS = 2 * CHECK_INTERVAL_SECONDS
+CHECK_INTERVAL_JITTER = 0.1  # Randomly shift each check by up to this fraction of the interval
+# Checks are also placed closer together around the times of day past updates were found, and further apart elsewhere:
+UPDATE_HISTORY_SIZE = 50  # No. of past update times remembered
+MIN_UPDATE_HISTORY = 5  # No. of past updates needed before check times are adjusted
+UPDATE_DENSITY_BANDWIDTH_HOURS = 1.5  # How far (in hours) each past update's influence spreads
+# User agent sent with the plain HTTP requests (the portal rejects the default python-requests one):
+USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/114.0.0.0 Safari/537.36"
+)
+HTTP_TIMEOUT_SECONDS = 15  # Timeout for each plain HTTP request
+HEAD_TIMEOUT_SECONDS = 5  # Timeout for the HEAD request that checks if the dashboard changed
+PAGE_LOAD_TIMEOUT_SECONDS = 15  # Timeout for each Selenium page load
+DASHBOARD_LOAD_TIMEOUT_SECONDS = 15  # How long to wait for the dashboard after signing in
+WAIT_POLL_SECONDS = 0.1  # How often Selenium waits re-check their condition
+# A Selenium check still running after this long is stalled; its chromedriver and Chrome are killed (keep it well below MIN_CHECK_INTERVAL_SECONDS):
+MAX_SELENIUM_CHECK_SECONDS = 5 * 60  # 5 min
+# Socket timeout for each WebDriver command, so a hung chromedriver can't block a check forever (keep it above PAGE_LOAD_TIMEOUT_SECONDS):
+WEBDRIVER_COMMAND_TIMEOUT_SECONDS = 60
+# How late a scheduled check may start (e.g. after the machine was asleep) and still be run:
+MISFIRE_GRACE_SECONDS = 5 * 60  # 5 min
+# The WebDriver is kept alive between Selenium checks and only recreated if it stops responding. Set the no. of consecutive successful checks after which its cookies and cache are cleared anyway:
+RECYCLE_DRIVER_AFTER_CHECKS = 24
+RECYCLE_DRIVER_HEAP_MB = 256  # Restart Chrome instead if the page's JS heap has grown past this
 # Do you want the driver to be headless? Headless means that the browser will run in the background without opening a window. Set this to True if you want the browser to run in the background:
 HEADLESS = True
+# Size of the browser window:
+WINDOW_SIZE = (1280, 800)
+# Chrome flags used to keep the browser's memory and CPU footprint small:
+CHROME_MINIMAL_ARGUMENTS = (
+    "--no-sandbox",
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--blink-settings=imagesEnabled=false",
+    "--disable-extensions",
+    "--disable-background-networking",
+)
+# Choose whether to also send push notifications (not functional yet, see `send_push_notification`):
+SEND_PUSH_NOTIFICATIONS = False
+SMTP_TIMEOUT_SECONDS = 30  # Timeout for connecting to and talking with the email server
+PUSH_CONNECT_TIMEOUT_SECONDS = 5  # Timeout for connecting to the push service
+PUSH_READ_TIMEOUT_SECONDS = 10  # Timeout for the push service's response
 # Choose whether to purge old screenshots:
 PURGE_SCREENSHOTS = True
 NUM_SCREENSHOTS_TO_KEEP = 5  # No. of screenshots to keep if purging
+SCREENSHOT_QUALITY = 60  # WebP quality (0-100) of saved screenshots
+# Region of the page captured in screenshots, and the scale it's captured at:
+SCREENSHOT_CLIP = {
+    "x": 0,
+    "y": 0,
+    "width": WINDOW_SIZE[0],
+    "height": WINDOW_SIZE[1],
+    "scale": 0.4,
+}
+# A check that fails unexpectedly is reported by email; the same error again is only reported once this much time has passed:
+ERROR_EMAIL_INTERVAL_SECONDS = 24 * 60 * 60  # 1 day
+# No-update checks don't send anything, except for one heartbeat email a day after this hour (set to None to disable):
+HEARTBEAT_HOUR = 9
+
+#
+# Patterns used to scrape the login form and dashboard HTML on the HTTP path.
+# These are compiled once at import rather than on every check.
+#
+_FORM_RE = re.compile(r"<form\b([^>]*)>(.*?)</form>", re.IGNORECASE | re.DOTALL)
+_INPUT_RE = re.compile(r"<input\b([^>]*)>", re.IGNORECASE)
+# One attribute of a tag, with its value double-, single- or un-quoted
+_ATTR_RE = re.compile(r"([\w:.-]+)\s*=\s*(?:\"([^\"]*)\"|'([^']*)'|([^\s\"'>]+))")
+_DATE_TEXT_RE = re.compile(
+    r"class=\"[^\"]*\bdate-text\b[^\"]*\"[^>]*>\s*([^<]+?)\s*<", re.IGNORECASE
+)
+# Parts of the dashboard HTML that change on every request (scripts, hidden
+# token fields, CSP nonces), removed before hashing the page.
+_VOLATILE_HTML_RE = re.compile(
+    r"<script\b.*?</script>|<input[^>]*\stype=\"hidden\"[^>]*>|\snonce=\"[^\"]*\"",
+    re.IGNORECASE | re.DOTALL,
+)
+
+#
+# Selenium locators and wait conditions, built once at import. The conditions
+# are stateless, so the same objects are reused by every wait.
+#
+_LOC_UCI = (By.ID, "uci")
+_LOC_PASSWORD = (By.ID, "password")
+_UCI_CLICKABLE = EC.element_to_be_clickable(_LOC_UCI)
+_PASSWORD_CLICKABLE = EC.element_to_be_clickable(_LOC_PASSWORD)
+# Reads the "Updated" date in a single script call (falsy until it's rendered)
+# rather than locating the element and then fetching its text separately.
+_DATE_TEXT = operator.methodcaller(
+    "execute_script", "return document.querySelector('.date-text')?.innerText"
+)
+_ON_DASHBOARD = EC.url_to_be(DASHBOARD_URL)
+
+# What a failed WebDriver command raises: a WebDriverException from
+# chromedriver, or a urllib3 error if chromedriver didn't answer in time.
+_DRIVER_ERRORS = (WebDriverException, urllib3.exceptions.HTTPError)
+
+# What failed, and what a timeout means, for each step of a Selenium check.
+_STEP_FAILURES = {
+    "login": "SIGN IN FAILED",
+    "check_for_updates": "UPDATE CHECK FAILED",
+}
+_STEP_TIMEOUTS = {
+    "login": "Either the username or password field was not located after 10 seconds",
+    "check_for_updates": "The 'Updated' field wasn't located after 10 seconds",
+}
+
+# In-memory copy of LAST_UPDATED_FILE; only read from disk on the first check.
+_state_cache = None
+# The last unexpected check error that was emailed, and when.
+_last_error_email = (None, None)
+# Paths of the screenshots currently kept on disk, oldest first.
+_recent_screenshots = collections.deque()
+# HTTP session for push notifications, so the connection to Pushover is
+# reused instead of doing a new TCP+TLS handshake for every notification.
+_push_session = requests.Session()
+_push_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=2,
+        max_retries=Retry(total=2, backoff_factor=0.5),
+    ),
+)
+# Threads used to send the email and push notifications in the background.
+# Their queued work is finished at interpreter exit, before `atexit` handlers
+# such as `mail_client.close` run.
+_notify_pool = concurrent.futures.ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix="notify"
+)
+
+
+class HTTPCheckError(Exception):
+    """Raised when the plain HTTP check can't read the dashboard."""
+
+
+def setup_session():
+    """Set up the persistent HTTP session used for the lightweight check.
+
+    Parameters
+    ----------
+    None
+
+    Returns
+    -------
+    session : requests.Session
+        The HTTP session.
+
+    Notes
+    -----
+    The session is kept for the lifetime of the script so that the TCP/TLS
+    connection to the portal is kept alive and reused between checks.
+    """
+    session = requests.Session()
+    session.headers.update({"User-Agent": USER_AGENT})
+    # Checks are sequential, so one pooled connection to the portal is enough.
+    session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+
+    return session
+
+
+def http_login(session):
+    """Log in to the IRCC portal over plain HTTP.
+
+    Parameters
+    ----------
+    session : requests.Session
+        The HTTP session.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    requests.RequestException
+        If any request fails or returns a 4xx/5xx status.
+    HTTPCheckError
+        If the login form or its username/password fields weren't found.
+
+    Notes
+    -----
+    The form is posted exactly as the page defines it: to its action URL,
+    with all of its hidden inputs (CSRF tokens and the like) and the
+    credentials under the names of its `#uci` and `#password` fields. If
+    the form can't be read, nothing is posted, so a changed login page
+    can't cause failed logins (and a lockout); Selenium signs in instead.
+    """
+    logger.debug("SIGNING IN (HTTP)")
+
+    response = session.get(LOGIN_URL, timeout=HTTP_TIMEOUT_SECONDS)
+    response.raise_for_status()
+
+    post_url, data = _read_login_form(response.text, response.url)
+    response = session.post(post_url, data=data, timeout=HTTP_TIMEOUT_SECONDS)
+    response.raise_for_status()
+
+
+def _tag_attrs(attrs):
+    """Return the attributes of an HTML tag as a dict.
+
+    Parameters
+    ----------
+    attrs : str
+        The part of the tag after its name, e.g. ` type="hidden" name="x"`.
+
+    Returns
+    -------
+    attrs : dict
+        The unescaped attribute values, by lowercase attribute name.
+    """
+    return {
+        match.group(1).lower(): html.unescape(
+            next(v for v in match.group(2, 3, 4) if v is not None)
+        )
+        for match in _ATTR_RE.finditer(attrs)
+    }
+
+
+def _read_login_form(page, page_url):
+    """Return where and what to post to log in with the login page's form.
+
+    Parameters
+    ----------
+    page : str
+        The login page's HTML.
+    page_url : str
+        The login page's URL, which relative form actions are resolved against.
+
+    Returns
+    -------
+    post_url : str
+        The form's action URL.
+    data : dict
+        The form fields to post: every hidden input plus the credentials.
+
+    Raises
+    ------
+    HTTPCheckError
+        If no form has both a named `#uci` and a named `#password` field.
+    """
+    for form in _FORM_RE.finditer(page):
+        data = {}
+        credentials = {}
+        for tag in _INPUT_RE.finditer(form.group(2)):
+            attrs = _tag_attrs(tag.group(1))
+            name = attrs.get("name")
+            if not name:
+                continue
+            if attrs.get("id") == "uci":
+                credentials["uci"] = name
+            elif attrs.get("id") == "password":
+                credentials["password"] = name
+            elif attrs.get("type", "").lower() == "hidden":
+                data[name] = attrs.get("value", "")
+        if len(credentials) < 2:
+            continue
+
+        data[credentials["uci"]] = USERNAME_IRCC
+        data[credentials["password"]] = PASSWORD_IRCC
+        action = _tag_attrs(form.group(1)).get("action")
+        return urljoin(page_url, action) if action else page_url, data
+
+    raise HTTPCheckError(
+        "***Login form with named #uci and #password fields not found inside "
+        "http_login()!***"
+    )
+
+
+def _conditional_headers():
+    """Return the conditional request headers for the saved dashboard version.
+
+    Returns
+    -------
+    headers : dict
+        If-None-Match/If-Modified-Since headers built from the saved
+        ETag/Last-Modified, for whichever of them are known.
+    """
+    state = read_state()
+    headers = {}
+    if state.get("etag"):
+        headers["If-None-Match"] = state["etag"]
+    if state.get("last_modified"):
+        headers["If-Modified-Since"] = state["last_modified"]
+
+    return headers
+
+
+def dashboard_unchanged(session):
+    """Check with a conditional HEAD request whether the dashboard changed.
+
+    Parameters
+    ----------
+    session : requests.Session
+        The HTTP session.
+
+    Returns
+    -------
+    unchanged : bool
+        True if the server confirmed (HTTP 304) that the dashboard still
+        matches the saved ETag/Last-Modified, False otherwise.
+
+    Raises
+    ------
+    requests.RequestException
+        If the request fails.
+    """
+    headers = _conditional_headers()
+    if not headers:
+        return False
+
+    # Don't follow redirects: an expired session redirects to the login page,
+    # which just means we can't tell and have to do the full check.
+    response = session.head(
+        DASHBOARD_URL,
+        headers=headers,
+        timeout=HEAD_TIMEOUT_SECONDS,
+        allow_redirects=False,
+    )
+
+    return response.status_code == 304
+
+
+def fetch_dashboard(session):
+    """Fetch the dashboard page with the session's current cookies.
+
+    Parameters
+    ----------
+    session : requests.Session
+        The HTTP session.
+
+    Returns
+    -------
+    response : requests.Response or None
+        The dashboard response, or None if the session isn't signed in
+        (HTTP 401/403 or a redirect away from the dashboard). The response
+        is an empty HTTP 304 if the dashboard hasn't changed since the last
+        fetch.
+
+    Raises
+    ------
+    requests.RequestException
+        If the request fails or returns any other 4xx/5xx status.
+    """
+    response = session.get(
+        DASHBOARD_URL, headers=_conditional_headers(), timeout=HTTP_TIMEOUT_SECONDS
+    )
+    if response.status_code in (401, 403) or response.url != DASHBOARD_URL:
+        return None
+    response.raise_for_status()
+
+    return response
+
+
+def copy_cookies_to_session(driver, session):
+    """Copy the WebDriver's cookies into the HTTP session.
+
+    Parameters
+    ----------
+    driver : selenium.webdriver (WebDriver)
+        The WebDriver object, signed in to the IRCC portal.
+    session : requests.Session
+        The HTTP session.
+
+    Returns
+    -------
+    None
+
+    Notes
+    -----
+    This lets the next checks read the dashboard over plain HTTP with the
+    session Selenium signed in, instead of falling back to Selenium again.
+    """
+    for cookie in driver.get_cookies():
+        session.cookies.set(
+            cookie["name"],
+            cookie["value"],
+            domain=cookie.get("domain"),
+            path=cookie.get("path", "/"),
+        )
+
+
+def _report_unchanged(now):
+    """Handle a check where the server said the dashboard hasn't changed.
+
+    Parameters
+    ----------
+    now : datetime.datetime
+        The time the current check started.
+
+    Returns
+    -------
+    None
+    """
+    logger.info("NO UPDATE FOUND...! The dashboard hasn't changed since the last check.")
+    if heartbeat_due(now):
+        # Quote the date as the portal showed it; states saved before the text
+        # was kept only have the timestamp.
+        last_updated = read_state().get("updated_text", read_last_updated())
+        if isinstance(last_updated, int):
+            date = datetime.date.fromtimestamp(last_updated)
+            last_updated = f"{date:%B} {date.day}, {date.year}"
+        send_notification(last_updated, False, None, now)
+
+
+def check_for_updates_http(session, now=None, pool=None):
+    """Check for updates on the IRCC portal without a browser.
+
+    Parameters
+    ----------
+    session : requests.Session
+        The HTTP session.
+    now : datetime.datetime (optional)
+        The time the current check started. Defaults to the current time.
+    pool : DriverPool (optional)
+        The pool holding the long-lived WebDriver, used to take a screenshot
+        only if an update is found.
+
+    Returns
+    -------
+    update : bool
+        True if the "Updated" date changed since the last check, False
+        otherwise.
+
+    Raises
+    ------
+    requests.RequestException
+        If any request fails or returns a 4xx/5xx status.
+    HTTPCheckError
+        If the dashboard didn't load or the "Updated" field wasn't found.
+
+    Notes
+    -----
+    A cheap conditional HEAD request is made first; if the dashboard hasn't
+    changed since the last check, the login and full page fetch are skipped.
+    Otherwise the session only signs in again if its cookies have expired,
+    and the page itself is fetched with a conditional GET, so an unchanged
+    page comes back as an empty HTTP 304 and isn't parsed. If the server
+    doesn't support conditional requests, a BLAKE2b hash of the page (minus
+    its per-request tokens) is compared to the last one instead.
+    """
+    if now is None:
+        now = datetime.datetime.now()
+
+    if dashboard_unchanged(session):
+        _report_unchanged(now)
+        return False
+
+    logger.debug("CHECKING FOR UPDATE (HTTP)")
+
+    # Reuse the session's cookies (from an earlier HTTP or Selenium login)
+    # and only sign in again if they've expired.
+    response = fetch_dashboard(session)
+    if response is None:
+        http_login(session)
+        response = fetch_dashboard(session)
+    if response is None:
+        raise HTTPCheckError(
+            "***Dashboard did NOT load inside check_for_updates_http()! "
+            "The session is not signed in.***"
+        )
+    if response.status_code == 304:
+        _report_unchanged(now)
+        return False
+
+    # Remember the dashboard's version for the next check's conditional requests
+    version = {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "page_hash": hashlib.blake2b(
+            _VOLATILE_HTML_RE.sub("", response.text).encode(), digest_size=16
+        ).hexdigest(),
+    }
+    if version["page_hash"] == read_state().get("page_hash"):
+        update_state(**version)
+        _report_unchanged(now)
+        return False
+
+    match = _DATE_TEXT_RE.search(response.text)
+    if match is None:
+        raise HTTPCheckError(
+            "***'Updated' field not found in the dashboard HTML inside "
+            "check_for_updates_http()!***"
+        )
+
+    update = handle_updated_date(
+        html.unescape(match.group(1)).strip(), now=now, pool=pool
+    )
+    update_state(**version)
+
+    return update
 
 
-@contextmanager
 def setup_webdriver():
-    """Set up the Selenium WebDriver and return it as a context manager.
+    """Set up the Selenium WebDriver.
 
     Parameters
     ----------
@@ -195,33 +824,269 @@ def setup_webdriver():
 
     Notes
     -----
-    The WebDriver is set up as a context manager so that it is automatically
-    closed when the script is finished running.
+    The caller owns the WebDriver and is responsible for quitting it. In
+    practice the WebDriver is only ever created and quit by `DriverPool`.
 
-    Context managers are used with the `with` statement. The `yield` statement
-    is used to return the WebDriver object. The `finally` statement is used to
-    close the WebDriver.
-
-    Context managers are useful for setting up and
-    tearing down resources. They're different from functions because they
-    automatically clean up after themselves. For more information, see:
-    https://book.pythontips.com/en/latest/context_managers.html
+    Implicit waits are disabled: every lookup goes through the returned
+    `WebDriverWait`, so don't call `driver.implicitly_wait` elsewhere.
     """
     options = Options()
     options.add_argument(
         "--disable-blink-features=AutomationControlled"
     )  # Disable the automation control warning
-    options.add_argument("--headless") if HEADLESS else None  # Set headless mode
-
+    options.add_argument("--headless=new") if HEADLESS else None  # Set headless mode
+    # Run Chrome with a minimal-resource profile: no GPU, extensions,
+    # background networking or image decoding (by far the heaviest subsystem).
+    for argument in CHROME_MINIMAL_ARGUMENTS:
+        options.add_argument(argument)
+    options.add_argument(
+        "--window-size={},{}".format(*WINDOW_SIZE)
+    )  # Fixed window size instead of maximizing the window
+    options.add_experimental_option(
+        "prefs", {"profile.managed_default_content_settings.images": 2}
+    )  # Don't load images
+    # Return from `driver.get` once the DOM is ready instead of waiting for
+    # every sub-resource; all lookups go through explicit waits anyway.
+    # (Selenium 3's Chrome `Options` has no `page_load_strategy` property.)
+    options.set_capability("pageLoadStrategy", "eager")
+
+    # Selenium 3 sends WebDriver commands without a socket timeout. Set one
+    # (for every connection created from now on) before creating the driver.
+    RemoteConnection.set_timeout(WEBDRIVER_COMMAND_TIMEOUT_SECONDS)
     driver = webdriver.Chrome(options=options)  # initialize the WebDriver
-    driver.maximize_window()  # maximize the window
-    wait = WebDriverWait(driver, 10)
+    # Explicit waits are the only waiting mechanism; mixing them with implicit
+    # waits multiplies the time spent polling for elements.
+    driver.implicitly_wait(0)
+    driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT_SECONDS)
+    wait = WebDriverWait(driver, 10, poll_frequency=WAIT_POLL_SECONDS)
+
+    return driver, wait
+
+
+class DriverPool:
+    """Hold a single long-lived WebDriver and recreate it only when needed.
+
+    Starting Chrome is the most expensive part of a Selenium check, so the
+    same WebDriver is handed out across checks. It is only rebuilt when a
+    health probe fails. After `max_checks` consecutive successful checks
+    its cookies and cache are cleared instead, and Chrome is only restarted
+    if its JS heap has grown past `RECYCLE_DRIVER_HEAP_MB`.
+
+    Parameters
+    ----------
+    max_checks : int (optional)
+        The number of consecutive successful checks after which the
+        WebDriver is reset.
+
+    Attributes
+    ----------
+    signed_in : bool
+        Whether the current WebDriver has signed in to the IRCC portal.
+
+    Methods
+    -------
+    acquire()
+        Return a healthy WebDriver, creating one if needed.
+    release()
+        Hand the WebDriver back after a successful check.
+    reset()
+        Clear the WebDriver's cookies and cache without restarting Chrome.
+    recycle()
+        Quit the WebDriver so the next `acquire()` creates a fresh one.
+    close()
+        Quit the WebDriver for good.
+    """
 
+    def __init__(self, max_checks=RECYCLE_DRIVER_AFTER_CHECKS):
+        self._driver = None
+        self._wait = None
+        self._max_checks = max_checks
+        self._num_checks = 0  # Consecutive successful checks
+        self._num_drivers = 0  # WebDrivers created so far
+        self.signed_in = False
+
+    def acquire(self):
+        """Return a healthy WebDriver, creating one if needed.
+
+        Returns
+        -------
+        driver : selenium.webdriver (WebDriver)
+            The WebDriver object.
+        wait : selenium.webdriver.support.wait.WebDriverWait
+            The WebDriverWait object.
+        """
+        if self._driver is not None:
+            try:
+                self._driver.execute_script("return 1")  # Health probe
+            except _DRIVER_ERRORS as e:
+                logger.warning("WebDriver No. %d is unhealthy: %s", self._num_drivers, e)
+                self.recycle()
+
+        if self._driver is None:
+            self._num_drivers += 1
+            logger.debug("Initializing WebDriver No. %d", self._num_drivers)
+            self._driver, self._wait = setup_webdriver()
+            logger.info("WebDriver No. %d Initialized.", self._num_drivers)
+
+        return self._driver, self._wait
+
+    def release(self):
+        """Hand the WebDriver back after a successful check.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        After a failed check, call `recycle()` instead.
+        """
+        self._num_checks += 1
+        if self._num_checks >= self._max_checks:
+            self.reset()
+
+    def reset(self):
+        """Clear the WebDriver's cookies and cache without restarting Chrome.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Clearing the cookies signs the WebDriver out, so the next check signs
+        in again. The WebDriver is recycled instead if its JS heap is larger
+        than `RECYCLE_DRIVER_HEAP_MB` or the reset fails.
+        """
+        self._num_checks = 0
+        self.signed_in = False
+        if self._driver is None:
+            return
+
+        try:
+            heap = self._driver.execute_cdp_cmd("Runtime.getHeapUsage", {})
+            heap_mb = heap["usedSize"] / (1024 * 1024)
+            if heap_mb > RECYCLE_DRIVER_HEAP_MB:
+                logger.info(
+                    "WebDriver No. %d is using %.0f MB of JS heap; recycling it.",
+                    self._num_drivers,
+                    heap_mb,
+                )
+                self.recycle()
+                return
+
+            self._driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+            self._driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            self._driver.get("about:blank")  # Drop the dashboard's DOM and JS heap
+        except _DRIVER_ERRORS as e:
+            logger.warning("Failed to reset WebDriver No. %d: %s", self._num_drivers, e)
+            self.recycle()
+            return
+        logger.info("WebDriver No. %d Reset.", self._num_drivers)
+
+    def recycle(self):
+        """Quit the WebDriver so the next `acquire()` creates a fresh one.
+
+        Returns
+        -------
+        None
+        """
+        self._num_checks = 0
+        self.signed_in = False
+        if self._driver is None:
+            return
+
+        logger.debug("Closing WebDriver No. %d", self._num_drivers)
+        # `driver.quit()` ends with a shutdown request to chromedriver that has
+        # no timeout at all. Only send the (timed out) quit command, which
+        # closes Chrome, and then kill whatever is left of chromedriver/Chrome.
+        try:
+            webdriver.Remote.quit(self._driver)
+        except Exception as e:  # E.g. chromedriver killed by the stall watchdog
+            logger.warning("Failed to quit WebDriver No. %d: %s", self._num_drivers, e)
+        _kill_driver_processes(self._driver)
+        self._driver = None
+        self._wait = None
+        # Collect the WebDriver's now-unreachable objects right away rather
+        # than letting them pile up over a long run.
+        gc.collect()
+        logger.info("WebDriver No. %d Closed.", self._num_drivers)
+
+    def close(self):
+        """Quit the WebDriver for good.
+
+        Returns
+        -------
+        None
+        """
+        self.recycle()
+
+
+def _process_tree(pid):
+    """Return the PID of a process and of all its descendants.
+
+    Parameters
+    ----------
+    pid : int
+        The PID of the root process.
+
+    Returns
+    -------
+    pids : list of int
+        The PIDs, parents before their children. Only `pid` itself if the
+        process table can't be read (e.g. no `ps` on Windows).
+    """
     try:
-        yield driver, wait
-    finally:
-        driver.quit()
-    # return driver, wait
+        output = subprocess.run(
+            ["ps", "-A", "-o", "pid=,ppid="],
+            capture_output=True,
+            text=True,
+            timeout=10,
+            check=True,
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return [pid]
+
+    children = collections.defaultdict(list)
+    for line in output.splitlines():
+        child, parent = map(int, line.split())
+        children[parent].append(child)
+
+    pids = [pid]
+    for parent in pids:  # Breadth-first, so the list grows as it's walked
+        pids.extend(children[parent])
+    return pids
+
+
+def _kill_driver_processes(driver):
+    """Kill a WebDriver's chromedriver and the Chrome processes it started.
+
+    Parameters
+    ----------
+    driver : selenium.webdriver (WebDriver)
+        The WebDriver object.
+
+    Returns
+    -------
+    None
+
+    Notes
+    -----
+    Chrome's processes are looked up before anything is killed: once
+    chromedriver is gone, its Chrome is orphaned and can't be found anymore.
+    Afterwards `driver.quit()` no longer tries to stop chromedriver itself.
+    """
+    process = driver.service.process
+    if process is None:
+        return
+
+    for pid in _process_tree(process.pid):
+        try:
+            os.kill(pid, getattr(signal, "SIGKILL", signal.SIGTERM))
+        except OSError:  # Already exited
+            pass
+    process.wait()
+    driver.service.process = None
 
 
 def login(driver, wait):
@@ -238,52 +1103,38 @@ def login(driver, wait):
     -------
     None
     """
-    logging.info("---------------------------------------")
-    logging.info("----- NAVIGATING TO LOGIN PAGE...-----")
-    logging.info("---------------------------------------")
+    logger.debug("NAVIGATING TO LOGIN PAGE...")
     driver.get(LOGIN_URL)  # open the login page
-    driver.execute_script("document.body.style.zoom='30%'")
 
-    logging.info("---------------------------------------")
-    logging.info("----- SIGNING IN -----")
-    logging.info("---------------------------------------")
+    logger.debug("SIGNING IN")
 
     # Wait for the username field to be located and input username
-    username_field = wait.until(EC.element_to_be_clickable((By.ID, "uci")))
+    username_field = wait.until(_UCI_CLICKABLE)
     username_field.send_keys(USERNAME_IRCC)
 
     # Wait for the password field to be located to input password
-    password_field = wait.until(EC.element_to_be_clickable((By.ID, "password")))
-
-    # Use a while loop to check if the dashboard has loaded
-    dashboard_loaded = False
-    num_tries = 0
-    while not dashboard_loaded and num_tries < 2:  # try twice
-        password_field.send_keys(PASSWORD_IRCC)  # input password
-        password_field.send_keys(Keys.RETURN)  # press enter
-        time.sleep(4)  # add a delay to allow the page to load
-
-        # Check if the dashboard loaded by comparing the current URL to the
-        # dashboard URL
-        if driver.current_url == DASHBOARD_URL:
-            dashboard_loaded = True
-        else:
-            num_tries += 1
+    password_field = wait.until(_PASSWORD_CLICKABLE)
 
-    if dashboard_loaded:
-        logging.info("======")
-        logging.info("SIGN IN SUCCESSFUL...!")
-        logging.info("Current URL: " + driver.current_url)
-        logging.info("======")
-    else:
+    password_field.send_keys(PASSWORD_IRCC)  # input password
+    password_field.send_keys(Keys.RETURN)  # press enter
+
+    # Wait for the current URL to change to the dashboard URL. This returns
+    # as soon as the dashboard loads instead of sleeping for a fixed time.
+    try:
+        WebDriverWait(
+            driver, DASHBOARD_LOAD_TIMEOUT_SECONDS, poll_frequency=WAIT_POLL_SECONDS
+        ).until(_ON_DASHBOARD)
+    except TimeoutException:
         raise Exception(
             "***Dashboard did NOT load inside login()! Current URL: "
             + driver.current_url
             + "***"
         )
 
+    logger.info("SIGN IN SUCCESSFUL...! Current URL: %s", driver.current_url)
+
 
-def check_for_updates(driver, wait):
+def check_for_updates(driver, wait, now=None, reload=False):
     """Check for updates on the IRCC portal.
 
     Parameters
@@ -292,53 +1143,304 @@ def check_for_updates(driver, wait):
         The WebDriver object.
     wait : selenium.webdriver.support.wait.WebDriverWait
         The WebDriverWait object.
+    now : datetime.datetime (optional)
+        The time the current check started. Defaults to the current time.
+    reload : bool (optional)
+        Whether to load the dashboard page first. Needed when the driver
+        signed in during an earlier check rather than just now.
 
     Returns
     -------
-    None
+    update : bool
+        True if the "Updated" date changed since the last check, False
+        otherwise.
+
+    Notes
+    -----
+    If the portal session has expired, the dashboard redirects to the login
+    page; in that case this signs in again and retries once.
     """
-    logging.info("---------------------------------------")
-    logging.info("----- CHECKING FOR UPDATE -----")
-    logging.info("---------------------------------------")
-    driver.execute_script("document.body.style.zoom='30%'")
-    # # Go to the dashboard page
-    # driver.get(DASHBOARD_URL)
+    logger.debug("CHECKING FOR UPDATE")
+    updated_date = _read_dashboard_date(driver, wait, reload)
+
+    return handle_updated_date(updated_date, driver, now)
+
+
+def _read_dashboard_date(driver, wait, reload=False):
+    """Wait for the dashboard and return its "Updated" date text.
+
+    Parameters
+    ----------
+    driver : selenium.webdriver (WebDriver)
+        The WebDriver object.
+    wait : selenium.webdriver.support.wait.WebDriverWait
+        The WebDriverWait object.
+    reload : bool (optional)
+        Whether to load the dashboard page first.
+
+    Returns
+    -------
+    updated_date : str
+        The "Updated" date scraped from the dashboard.
+    """
+    if reload:
+        driver.get(DASHBOARD_URL)  # Go to the dashboard page
 
     # Wait for the "Updated" field to be located
-    updated_date = wait.until(
-        EC.presence_of_element_located((By.CLASS_NAME, "date-text"))
-    ).text
+    try:
+        return wait.until(_DATE_TEXT)
+    except TimeoutException:
+        if LOGIN_URL not in driver.current_url:
+            raise
+        logger.info("Portal session expired; signing in again.")
+        login(driver, wait)
+        return wait.until(_DATE_TEXT)
 
-    # Check if the "Last updated" date has changed since the last time the script ran
-    with open(LAST_UPDATED_FILE, "r") as f:
-        last_updated_date = f.read().strip()
 
-    # Get current date
-    now = datetime.datetime.now()
-    # Format date as "Month day, year"
-    date_in_words = now.strftime("%B %d, %Y")
-    if updated_date != last_updated_date:
-        logging.info("======")
-        logging.info("UPDATE FOUND...!")
-        logging.info(f"The IRCC portal was updated on {updated_date}.")
-        logging.info("======")
+def handle_updated_date(updated_date, driver=None, now=None, pool=None):
+    """Compare the scraped "Updated" date to the stored one and notify.
 
-        update = True
-        screenshot_path = take_screenshot(driver, update)
-        send_notification(updated_date, update, screenshot_path)
+    Parameters
+    ----------
+    updated_date : str
+        The "Updated" date scraped from the dashboard.
+    driver : selenium.webdriver (WebDriver) (optional)
+        The WebDriver object the date was scraped with, if any.
+    now : datetime.datetime (optional)
+        The time the current check started. Defaults to the current time.
+    pool : DriverPool (optional)
+        The pool holding the long-lived WebDriver. If there's no `driver`
+        (HTTP path), the screenshot of an update is taken with the pool's
+        WebDriver instead.
+
+    Returns
+    -------
+    update : bool
+        True if the "Updated" date changed since the last check, False
+        otherwise.
+
+    Notes
+    -----
+    A screenshot and notification are only produced when the date changed.
+    When it didn't, at most one heartbeat email (without a screenshot) is
+    sent per day; see `heartbeat_due()`.
+    """
+    # Check if the "Last updated" date has changed since the last time the
+    # script ran. Dates are compared as timestamps so that formatting/whitespace
+    # changes in the text don't count as updates; the text is only used for
+    # the email body (and for the comparison if it can't be parsed).
+    if now is None:
+        now = datetime.datetime.now()
+
+    updated_date = " ".join(updated_date.split())
+    updated_ts = parse_updated_date(updated_date)
+    update = updated_ts != read_last_updated()
+    if update:
+        logger.info("UPDATE FOUND...! The IRCC portal was updated on %s.", updated_date)
+
+        if driver is not None:
+            screenshot_path = take_screenshot(driver, update)
+        elif pool is not None:
+            # Found over HTTP: only start the browser now that it's needed
+            screenshot_path = _screenshot_dashboard(pool)
+        else:
+            screenshot_path = None
+        send_notification(updated_date, update, screenshot_path, now)
 
         # Update the last updated date
-        with open(LAST_UPDATED_FILE, "w") as f:
-            f.write(updated_date)
+        write_last_updated(updated_ts, now, updated_date)
     else:
-        logging.info("======")
-        logging.info("NO UPDATE FOUND...!")
-        logging.info(f"Last update was on {updated_date}.")
-        logging.info("======")
+        logger.info("NO UPDATE FOUND...! Last update was on %s.", updated_date)
+        # Keep the text as shown, for heartbeats of checks that don't read it
+        update_state(updated_text=updated_date)
+
+        # Nothing changed, so don't take a screenshot or send an email,
+        # except for a short daily heartbeat to show the script is alive.
+        if heartbeat_due(now):
+            send_notification(updated_date, False, None, now)
+
+    return update
+
+
+def heartbeat_due(now=None):
+    """Return whether the daily "no update" heartbeat email should be sent.
+
+    Parameters
+    ----------
+    now : datetime.datetime (optional)
+        The time the current check started. Defaults to the current time.
+
+    Returns
+    -------
+    due : bool
+        True the first time this is called on a given day at or after
+        `HEARTBEAT_HOUR`, False otherwise.
+
+    Notes
+    -----
+    The date of the last heartbeat is saved with the rest of the state, so
+    restarting the script doesn't send a second heartbeat on the same day.
+    """
+    if HEARTBEAT_HOUR is None:
+        return False
+
+    if now is None:
+        now = datetime.datetime.now()
+    today = now.date().isoformat()
+    if now.hour < HEARTBEAT_HOUR or read_state().get("heartbeat") == today:
+        return False
+
+    update_state(heartbeat=today)
+    return True
+
+
+def parse_updated_date(text):
+    """Parse an "Updated" date like "May 17, 2023" into an epoch timestamp.
+
+    Parameters
+    ----------
+    text : str
+        The "Updated" date as shown on the dashboard.
+
+    Returns
+    -------
+    timestamp : int or str
+        The date as a Unix timestamp (local midnight), or the text with its
+        whitespace normalized if it isn't a date in the expected format.
+
+    Notes
+    -----
+    Falling back to the text keeps an unexpected format (a prefix, another
+    language's month names) from breaking every check: the text is then
+    compared as is, like the script did before dates were parsed.
+    """
+    # Collapse any whitespace drift (extra spaces, newlines) before parsing
+    text = " ".join(text.split())
+    try:
+        return int(datetime.datetime.strptime(text, "%B %d, %Y").timestamp())
+    except ValueError:
+        logger.warning("Couldn't parse the Updated date %r; comparing it as text.", text)
+        return text
+
+
+def read_state():
+    """Return the saved state, reading `LAST_UPDATED_FILE` only once.
+
+    Parameters
+    ----------
+    None
+
+    Returns
+    -------
+    state : dict
+        The saved state: the last updated date as a Unix timestamp
+        ("updated") and as shown on the dashboard ("updated_text"), the
+        dashboard's last ETag ("etag") and Last-Modified ("last_modified")
+        headers and content hash ("page_hash"), the Unix timestamps at which
+        the latest updates were found ("history"), and the ISO date of the
+        last "no update" heartbeat ("heartbeat"), where known.
+
+    Notes
+    -----
+    A missing file is treated as an empty state. Files written by older
+    versions of the script hold only the timestamp or the date text itself
+    rather than JSON; both are still understood. Date text that doesn't
+    parse is kept as text (see `parse_updated_date()`).
+    """
+    global _state_cache
+
+    if _state_cache is None:
+        # On a fresh install there's no state yet; the first check creates it.
+        try:
+            with open(LAST_UPDATED_FILE, "r") as f:
+                contents = f.read().strip()
+        except FileNotFoundError:
+            contents = ""
+
+        if not contents:
+            _state_cache = {}
+        elif contents.startswith("{"):
+            _state_cache = json.loads(contents)
+        elif contents.isdigit():
+            _state_cache = {"updated": int(contents)}
+        else:
+            _state_cache = {"updated": parse_updated_date(contents)}
+
+    return _state_cache
+
+
+def update_state(**changes):
+    """Atomically write the changed state values and update the cache.
+
+    Parameters
+    ----------
+    **changes
+        The state values to change, e.g. ``updated=...`` or ``etag=...``.
+
+    Returns
+    -------
+    None
+
+    Notes
+    -----
+    Nothing is written if the values are unchanged.
+    """
+    global _state_cache
+
+    state = {**read_state(), **changes}
+    if state == _state_cache:
+        return
+
+    # Write to a temporary file first and swap it in so that a crash
+    # mid-write can't leave a truncated file behind.
+    tmp_path = LAST_UPDATED_FILE + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(state, f)
+    os.replace(tmp_path, LAST_UPDATED_FILE)
+
+    _state_cache = state
+
+
+def read_last_updated():
+    """Return the last updated date as a Unix timestamp, or 0 if none is saved.
+
+    Parameters
+    ----------
+    None
+
+    Returns
+    -------
+    last_updated_ts : int or str
+        The last updated date as a Unix timestamp, or its normalized text if
+        it couldn't be parsed (see `parse_updated_date()`).
+    """
+    return read_state().get("updated", 0)
+
+
+def write_last_updated(updated_ts, found_at=None, text=None):
+    """Save the last updated date.
 
-        update = False
-        screenshot_path = take_screenshot(driver)
-        send_notification(updated_date, update, screenshot_path)
+    Parameters
+    ----------
+    updated_ts : int or str
+        The new last updated date as returned by `parse_updated_date()`.
+    found_at : datetime.datetime (optional)
+        When the update was found. If given, it's added to the update
+        history used to place future checks.
+    text : str (optional)
+        The date as shown on the dashboard, quoted by heartbeat emails.
+
+    Returns
+    -------
+    None
+    """
+    changes = {"updated": updated_ts}
+    if text is not None:
+        changes["updated_text"] = text
+    if found_at is not None:
+        history = read_state().get("history", []) + [int(found_at.timestamp())]
+        changes["history"] = history[-UPDATE_HISTORY_SIZE:]
+    update_state(**changes)
 
 
 def take_screenshot(driver, update=False):
@@ -354,34 +1456,84 @@ def take_screenshot(driver, update=False):
     Returns
     -------
     screenshot_path : str
-        The path to the screenshot.
+        The path to the screenshot (a WebP image).
     """
-    logging.info("---------------------------------------")
-    logging.info("----- TAKING & SAVING SCREENSHOT -----")
-    logging.info("---------------------------------------")
-    if not os.path.exists(SCREENSHOTS_DIR):
-        os.makedirs(SCREENSHOTS_DIR)
+    logger.debug("TAKING & SAVING SCREENSHOT")
 
-    if update:
-        screenshot_filename = (
-            f"{datetime.datetime.now().strftime('%Y%m%d%H%M%S')}-update.png"
-        )
-    else:
-        screenshot_filename = (
-            f"{datetime.datetime.now().strftime('%Y%m%d%H%M%S')}-no_update.png"
-        )
+    # Name screenshots by their nanosecond epoch timestamp, which is cheaper
+    # than formatting a datetime and still sorts chronologically.
+    screenshot_filename = f"{time.time_ns()}-{'update' if update else 'no_update'}.webp"
     screenshot_path = os.path.join(SCREENSHOTS_DIR, screenshot_filename)
 
-    driver.execute_script("document.body.style.zoom='30%'")
-    driver.save_screenshot(screenshot_path)
-    logging.info("======")
-    logging.info("SCREENSHOT TAKEN & SAVED...!")
-    logging.info("======")
+    # Capture a scaled-down WebP directly through the DevTools Protocol. This
+    # replaces zooming the page out with JS (a full re-layout) before taking a
+    # full-size PNG, and keeps the screenshot size the same on every check.
+    data = driver.execute_cdp_cmd(
+        "Page.captureScreenshot",
+        {
+            "format": "webp",
+            "quality": SCREENSHOT_QUALITY,
+            "clip": SCREENSHOT_CLIP,
+        },
+    )["data"]
+    with open(screenshot_path, "wb") as f:
+        f.write(base64.b64decode(data))
+
+    # Delete the oldest screenshots we wrote ourselves rather than scanning
+    # the whole directory after every check. A screenshot someone already
+    # deleted by hand mustn't fail the check (and the UPDATE email with it).
+    if PURGE_SCREENSHOTS:
+        _recent_screenshots.append(screenshot_path)
+        while len(_recent_screenshots) > NUM_SCREENSHOTS_TO_KEEP:
+            try:
+                os.unlink(_recent_screenshots.popleft())
+            except FileNotFoundError:
+                pass
+    logger.info("SCREENSHOT TAKEN & SAVED...!")
 
     return screenshot_path
 
 
-def send_notification(updated_date, update, screenshot_path):
+def _screenshot_dashboard(pool):
+    """Take a screenshot of the dashboard with the pool's WebDriver.
+
+    Parameters
+    ----------
+    pool : DriverPool
+        The pool holding the long-lived WebDriver.
+
+    Returns
+    -------
+    screenshot_path : str or None
+        The path to the screenshot, or None if it couldn't be taken.
+
+    Notes
+    -----
+    Used when an update was found over HTTP, so that the update email still
+    comes with a screenshot. A failure here is logged and the notification
+    is sent without the screenshot rather than not at all.
+    """
+    try:
+        driver, wait = pool.acquire()
+        reload = pool.signed_in
+        if not pool.signed_in:
+            login(driver, wait)
+        _read_dashboard_date(driver, wait, reload)
+        pool.signed_in = True
+        screenshot_path = take_screenshot(driver, update=True)
+    except Exception:
+        logger.exception(
+            "Couldn't take a screenshot of the updated dashboard; "
+            "sending the notification without it."
+        )
+        pool.recycle()
+        return None
+
+    pool.release()
+    return screenshot_path
+
+
+def send_notification(updated_date, update, screenshot_path, now=None):
     """Send a notification that the IRCC portal has been updated.
 
     Parameters
@@ -392,38 +1544,163 @@ def send_notification(updated_date, update, screenshot_path):
         Whether or not the IRCC portal was updated.
     screenshot_path : str
         The path to the screenshot.
+    now : datetime.datetime (optional)
+        The time the current check started. Defaults to the current time.
 
     Returns
     -------
     None
+
+    Notes
+    -----
+    The email and push notification are only queued on `_notify_pool`, so
+    the check doesn't wait on the network. Failures are logged when they
+    happen.
     """
-    logging.info("---------------------------------------")
-    logging.info("----- SENDING NOTIFICATION -----")
-    logging.info("---------------------------------------")
+    logger.debug("SENDING NOTIFICATION")
 
-    # Get current date
-    now = datetime.datetime.now()
+    if now is None:
+        now = datetime.datetime.now()
     # Format date as "Month day, year"
     date_in_words = now.strftime("%B %d, %Y")
-    # date_today = datetime.datetime.now.strftime("%B %d, %Y")
 
     if update:
-        send_email(
-            "IRCC Portal UPDATE!!",
-            f"The IRCC portal was updated on {updated_date}.",
-            screenshot_path,
-        )
+        subject = "IRCC Portal UPDATE!!"
+        body = f"The IRCC portal was updated on {updated_date}."
     else:
-        send_email(
-            "IRCC Portal Sem to Sem :-(",
-            f"No update on the IRCC portal as of {date_in_words}.\n Last update was on {updated_date}.",
-            screenshot_path,
+        subject = "IRCC Portal Sem to Sem :-("
+        body = f"No update on the IRCC portal as of {date_in_words}.\n Last update was on {updated_date}."
+
+    # Send the email and push notification concurrently in the background,
+    # since they're independent network round-trips.
+    future = _notify_pool.submit(send_email, subject, body, screenshot_path)
+    future.add_done_callback(functools.partial(_log_notification_failure, "email"))
+    if SEND_PUSH_NOTIFICATIONS:
+        future = _notify_pool.submit(send_push_notification, subject, body)
+        future.add_done_callback(functools.partial(_log_notification_failure, "push"))
+
+    logger.info("NOTIFICATION QUEUED...!")
+
+
+def _log_notification_failure(kind, future):
+    """Log the exception of a failed notification, if any.
+
+    Parameters
+    ----------
+    kind : str
+        The kind of notification, e.g. "email".
+    future : concurrent.futures.Future
+        The finished notification.
+
+    Returns
+    -------
+    None
+    """
+    if future.exception() is not None:
+        logger.error(
+            "Sending %s notification failed:", kind, exc_info=future.exception()
         )
 
-    logging.info("======")
-    logging.info("NOTIFICATION SENT SUCCESSFULLY...!")
-    logging.info("======")
-    # send_push_notification("IRCC Portal Update", f"The IRCC portal was updated on {updated_date}.")
+
+class MailClient:
+    """Keep a single authenticated SMTP connection open across emails.
+
+    The TLS handshake and SMTP AUTH dialog are paid once; later emails
+    reuse the connection after a `NOOP` confirms it's still alive, and
+    reconnect if the server has dropped it.
+
+    Parameters
+    ----------
+    server : str
+        The SMTP server.
+    port : int
+        The SMTP (SSL) port.
+    address : str
+        The email address to log in and send from.
+    password : str
+        The email password.
+
+    Methods
+    -------
+    send(msg)
+        Send an email message to `address`.
+    close()
+        Close the SMTP connection, if open.
+    """
+
+    def __init__(self, server, port, address, password):
+        self._server = server
+        self._port = port
+        self._address = address
+        self._password = password
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        # Creates a secure SSL context and an SMTP object, then logs in.
+        self._conn = smtplib.SMTP_SSL(
+            self._server, self._port, timeout=SMTP_TIMEOUT_SECONDS
+        )
+        self._conn.login(self._address, self._password)
+        logger.info("Logged in to email server.")
+
+    def _is_alive(self):
+        try:
+            return self._conn.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def send(self, msg):
+        """Send an email message to `address`.
+
+        Parameters
+        ----------
+        msg : email.message.Message
+            The email message.
+
+        Returns
+        -------
+        None
+        """
+        with self._lock:
+            if self._conn is not None and not self._is_alive():
+                logger.info("Email server connection is stale; reconnecting.")
+                # Close the dead socket rather than leaking it
+                try:
+                    self._conn.close()
+                except OSError:
+                    pass
+                self._conn = None
+            if self._conn is None:
+                self._connect()
+
+            # `send_message` serializes straight to bytes, avoiding the extra
+            # full-size str copy that `msg.as_string()` + `sendmail` makes.
+            try:
+                self._conn.send_message(msg, self._address, [self._address])
+            except smtplib.SMTPServerDisconnected:
+                self._connect()
+                self._conn.send_message(msg, self._address, [self._address])
+
+    def close(self):
+        """Close the SMTP connection, if open.
+
+        Returns
+        -------
+        None
+        """
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                self._conn.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._conn = None
+
+
+mail_client = MailClient(EMAIL_SERVER, EMAIL_PORT, EMAIL_ADDRESS, EMAIL_PASSWORD)
+atexit.register(mail_client.close)
 
 
 def send_email(subject, body, screenshot_path=None):
@@ -442,7 +1719,7 @@ def send_email(subject, body, screenshot_path=None):
     -------
     None
     """
-    logging.info("------ Sending email... ------")
+    logger.debug("Sending email...")
 
     msg = MIMEMultipart()
     msg["From"] = EMAIL_ADDRESS
@@ -450,13 +1727,14 @@ def send_email(subject, body, screenshot_path=None):
     msg["Subject"] = subject
 
     msg.attach(MIMEText(body, "plain"))
-    logging.info("Attached body to email.")
+    logger.debug("Attached body to email.")
 
     try:
         if screenshot_path is not None:
             with open(screenshot_path, "rb") as f:
                 # Attach the screenshot
-                img = MIMEImage(f.read())
+                # Passing the subtype skips sniffing the image type
+                img = MIMEImage(f.read(), _subtype="webp")
                 img.add_header(
                     "Content-Disposition",
                     "attachment",
@@ -464,28 +1742,13 @@ def send_email(subject, body, screenshot_path=None):
                 )
                 msg.attach(img)
 
-            logging.info("Attached screenshot to email.")
+            logger.debug("Attached screenshot to email.")
 
-        server = smtplib.SMTP_SSL(
-            EMAIL_SERVER, EMAIL_PORT
-        )  # This line of code creates a secure SSL context and creates an SMTP object.
-        # server.starttls()
-        server.login(EMAIL_ADDRESS, EMAIL_PASSWORD)
-        logging.info("Logged in to email server.")
-        text = msg.as_string()
-        server.sendmail(EMAIL_ADDRESS, EMAIL_ADDRESS, text)
-        logging.info("Sent email.")
-        server.quit()
+        mail_client.send(msg)
 
-        logging.info("------ Email sent successfully...! ------")
+        logger.info("Email sent successfully...!")
     except Exception as e:
-        logging.error("!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!")
-        logging.error("!!!!!! EXCEPTION: OTHER inside send_email() !!!!!!!")
-        logging.error("!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!")
-        logging.error(f"EMAIL SEND FAILED -- An error occurred:")
-        logging.exception(e)
-        # traceback.print_exc()
-        logging.error("!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!\n")
+        logger.exception("EMAIL SEND FAILED inside send_email() -- An error occurred: %s", e)
         return
 
 
@@ -508,230 +1771,441 @@ def send_push_notification(title, message):
     Pushover API: https://pushover.net/api.
     Note that this method is currently not operational. If you want to use it, you will need to create a Pushover account and get your own API token and user key.
     """
-    logging.info("------ Sending push notification... ------")
+    logger.debug("Sending push notification...")
 
     url = "https://api.pushover.net/1/messages.json"
     data = {"token": PUSH_TOKEN, "user": PUSH_USER, "title": title, "message": message}
-    response = requests.post(url, data=data)
+    response = _push_session.post(
+        url, data=data, timeout=(PUSH_CONNECT_TIMEOUT_SECONDS, PUSH_READ_TIMEOUT_SECONDS)
+    )
 
     if response.status_code != 200:
-        logging.error(f"Failed to send push notification: {response.text}")
+        logger.error("Failed to send push notification: %s", response.text)
+        return
+
+    logger.info("Push notification sent successfully...!")
+
+
+def _handle_step_error(name, exc, driver, timeout=False):
+    """Report a failed Selenium step by log and email.
+
+    Parameters
+    ----------
+    name : str
+        The name of the step that failed, e.g. "login".
+    exc : Exception
+        The exception raised by the step.
+    driver : selenium.webdriver (WebDriver) or None
+        The WebDriver object, used for a screenshot of the failure. If None,
+        no screenshot is taken.
+    timeout : bool (optional)
+        Whether or not the step failed with a TimeoutException.
+
+    Returns
+    -------
+    None
+    """
+    if timeout:
+        logger.exception(
+            "%s after trying %s() -- TimeoutException -- %s",
+            _STEP_FAILURES[name],
+            name,
+            _STEP_TIMEOUTS[name],
+        )
+        email_body = f"{_STEP_FAILURES[name]} after trying {name}() -- TimeoutException occurred: {exc}"
+    else:
+        logger.exception(
+            "%s after trying %s() -- An error occurred: %s",
+            _STEP_FAILURES[name],
+            name,
+            exc,
+        )
+        email_body = f"{_STEP_FAILURES[name]} after trying {name}() -- An error occurred: {exc}"
+
+    screenshot_path = None
+    if driver is not None:
+        try:
+            screenshot_path = take_screenshot(driver)
+        except _DRIVER_ERRORS:
+            logger.warning("Couldn't take a screenshot of the failed step.")
+    send_email("IRCC Portal Script Error", email_body, screenshot_path)
+
+
+def _report_job_error(exc, now=None):
+    """Report a check that failed unexpectedly by email.
+
+    Parameters
+    ----------
+    exc : Exception
+        The exception raised by the check.
+    now : datetime.datetime (optional)
+        The current time. Defaults to the current time.
+
+    Returns
+    -------
+    None
+
+    Notes
+    -----
+    Such errors (e.g. an unwritable state file, or Chrome failing to start)
+    tend to repeat on every check, so the same error is only emailed again
+    after `ERROR_EMAIL_INTERVAL_SECONDS`. A different error is emailed
+    right away.
+    """
+    global _last_error_email
+
+    if now is None:
+        now = datetime.datetime.now()
+    error = f"{type(exc).__name__}: {exc}"
+    last_error, last_sent = _last_error_email
+    if error == last_error:
+        if (now - last_sent).total_seconds() < ERROR_EMAIL_INTERVAL_SECONDS:
+            return
+
+    _last_error_email = (error, now)
+    send_email(
+        "IRCC Portal Script Error",
+        f"UPDATE CHECK FAILED after trying check_job() -- An error occurred: {error}",
+    )
+
+
+def _fallback_selenium_check(pool, session, now=None):
+    """Check for updates with Selenium when the plain HTTP check fails.
+
+    Parameters
+    ----------
+    pool : DriverPool
+        The pool holding the long-lived WebDriver.
+    session : requests.Session
+        The HTTP session; it's given the WebDriver's cookies after signing in.
+    now : datetime.datetime (optional)
+        The time the current check started. Defaults to the current time.
+
+    Returns
+    -------
+    update : bool
+        True if the "Updated" date changed since the last check, False
+        otherwise (including when a step failed).
+
+    Notes
+    -----
+    A failed step is reported by email and the WebDriver is recycled, but
+    the script keeps running; the next scheduled check starts afresh.
+
+    Every WebDriver command times out after
+    `WEBDRIVER_COMMAND_TIMEOUT_SECONDS`, including the ones outside the
+    steps (acquiring, resetting and quitting the WebDriver). If the steps
+    together take longer than `MAX_SELENIUM_CHECK_SECONDS`, a watchdog also
+    kills chromedriver and Chrome so that the pending command fails instead
+    of blocking the scheduler.
+    """
+    driver, wait = pool.acquire()
+
+    # Only sign in once per WebDriver; later checks reuse its portal session.
+    steps = []
+    if not pool.signed_in:
+        steps.append(("login", functools.partial(login, driver, wait)))
+    steps.append(
+        (
+            "check_for_updates",
+            functools.partial(
+                check_for_updates, driver, wait, now, reload=pool.signed_in
+            ),
+        )
+    )
+    stalled = threading.Event()
+
+    def on_stall():
+        stalled.set()
+        logger.error(
+            "Selenium check still running after %d s; killing chromedriver and Chrome.",
+            MAX_SELENIUM_CHECK_SECONDS,
+        )
+        # `driver.quit()` would first send a request to the same hung
+        # chromedriver, so kill its processes directly; the pending command
+        # then fails with a connection error.
+        _kill_driver_processes(driver)
+
+    watchdog = threading.Timer(MAX_SELENIUM_CHECK_SECONDS, on_stall)
+    watchdog.daemon = True
+    watchdog.start()
+    try:
+        for name, step in steps:
+            try:
+                update = step()
+            except Exception as e:
+                # A stalled (now killed) WebDriver can't take a screenshot
+                _handle_step_error(
+                    name,
+                    e,
+                    None if stalled.is_set() else driver,
+                    timeout=isinstance(e, TimeoutException),
+                )
+                pool.recycle()  # Start the next check from a fresh WebDriver
+                return False
+    finally:
+        watchdog.cancel()
+
+    pool.signed_in = True
+    copy_cookies_to_session(driver, session)
+
+    pool.release()
+
+    return update
+
+
+def check_job(session, pool):
+    """Run a single update check; scheduled by `main()`.
+
+    Parameters
+    ----------
+    session : requests.Session
+        The HTTP session.
+    pool : DriverPool
+        The pool holding the long-lived WebDriver.
+
+    Returns
+    -------
+    update : bool
+        True if the "Updated" date changed since the last check, False
+        otherwise.
+    """
+    logger.info("STARTING UPDATE CHECK")
+
+    # Read the clock once per check and share it with the helpers.
+    now = datetime.datetime.now()
+
+    try:
+        update = check_for_updates_http(session, now, pool)
+
+    except (requests.RequestException, HTTPCheckError) as e:
+        logger.warning("HTTP CHECK FAILED -- Falling back to Selenium: %s", e)
+        update = _fallback_selenium_check(pool, session, now)
+
+    logger.info("ENDING UPDATE CHECK")
+
+    return update
+
 
-    logging.info("------ Push notification sent successfully...! ------")
+def next_check_interval(interval, update):
+    """Return the number of seconds to wait before the next check.
+
+    Parameters
+    ----------
+    interval : float
+        The current check interval, in seconds.
+    update : bool
+        Whether the last check found an update.
+
+    Returns
+    -------
+    interval : int
+        The next check interval, in seconds, between
+        `MIN_CHECK_INTERVAL_SECONDS` and `MAX_CHECK_INTERVAL_SECONDS`.
+
+    Notes
+    -----
+    Updates tend to come in clusters, so the interval is halved after one
+    and then grows by 10% per quiet check.
+    """
+    if update:
+        return int(max(MIN_CHECK_INTERVAL_SECONDS, interval // 2))
+    return int(min(MAX_CHECK_INTERVAL_SECONDS, interval * 1.1))
+
+
+def update_density(when, history):
+    """Return how likely an update is at a time of day, relative to uniform.
+
+    Parameters
+    ----------
+    when : datetime.datetime
+        The time to evaluate.
+    history : list of int
+        The Unix timestamps at which past updates were found.
+
+    Returns
+    -------
+    density : float
+        A Gaussian kernel density estimate over the time of day of past
+        updates, scaled so that 1.0 means "as likely as any other time".
+        Always 1.0 until `MIN_UPDATE_HISTORY` updates have been seen.
+    """
+    if len(history) < MIN_UPDATE_HISTORY:
+        return 1.0
+
+    hour = when.hour + when.minute / 60
+    bandwidth = UPDATE_DENSITY_BANDWIDTH_HOURS
+    total = 0.0
+    for ts in history:
+        found_at = datetime.datetime.fromtimestamp(ts)
+        # Distance around the 24 h clock, so 23:00 and 01:00 are 2 h apart
+        distance = abs(hour - found_at.hour - found_at.minute / 60) % 24
+        distance = min(distance, 24 - distance)
+        total += math.exp(-0.5 * (distance / bandwidth) ** 2)
+
+    return 24 * total / (len(history) * bandwidth * math.sqrt(2 * math.pi))
+
+
+def next_check_delay(interval, now=None):
+    """Place the next check according to the times of past updates.
+
+    Parameters
+    ----------
+    interval : float
+        The base check interval from `next_check_interval()`, in seconds.
+    now : datetime.datetime (optional)
+        The current time. Defaults to the current time.
+
+    Returns
+    -------
+    delay : int
+        The number of seconds until the next check, between
+        `MIN_CHECK_INTERVAL_SECONDS` and `MAX_CHECK_INTERVAL_SECONDS`.
+
+    Notes
+    -----
+    The delay is the time it takes for `update_density()`, integrated
+    forward from `now`, to add up to the base interval. Checks therefore
+    bunch up at the times of day updates usually show up and thin out
+    during quiet hours, while the number of checks per day stays about the
+    same as with the base interval alone.
+    """
+    if now is None:
+        now = datetime.datetime.now()
+
+    history = read_state().get("history", [])
+    step = 60  # Integrate the density in 1-min steps
+    delay = 0
+    remaining = interval
+    while remaining > 0 and delay < MAX_CHECK_INTERVAL_SECONDS:
+        delay += step
+        remaining -= step * update_density(
+            now + datetime.timedelta(seconds=delay), history
+        )
+
+    return int(min(MAX_CHECK_INTERVAL_SECONDS, max(MIN_CHECK_INTERVAL_SECONDS, delay)))
 
 
 def main():
     """Main function."""
-    logging.info("=======================================")
-    logging.info("=======================================")
-    logging.info("=======================================")
-    logging.info("===== IRCC PORTAL UPDATE CHECKER ======")
-    logging.info("=======================================")
-
-    # # Initial WebDriver setup
-    # logging.info("=======================================")
-    # logging.info("----- Initial WebDriver Setup... -----")
-    # logging.info("=======================================")
-    # logging.info("----- First WebDriver Initialized. -----\n\n\n")
-
-    i = 1
-    j = 1
-    while True:
-        logging.info("---------------------------------------")
-        logging.info(f"----- Initializing WebDriver No. {j} -----")
-        logging.info("---------------------------------------")
-
-        with setup_webdriver() as (driver, wait):
-            logging.info(f"----- WebDriver No. {j} Reinitialized. -----\n")
-
-            start_time = time.time()
-            while True:
-                logging.info("=======================================")
-                logging.info(f"====== STARTING UPDATE CHECK No. {i} =======")
-                logging.info("=======================================")
+    logger.info("IRCC PORTAL UPDATE CHECKER")
+
+    # Everything created at import (modules, config, compiled patterns) lives
+    # for the whole run; move it out of the garbage collector's scans.
+    gc.collect()
+    gc.freeze()
+
+    # Create the screenshots directory once here rather than on every screenshot
+    os.makedirs(SCREENSHOTS_DIR, exist_ok=True)
+    # Purge old screenshots left over from previous runs if PURGE_SCREENSHOTS
+    # is True; after that `take_screenshot` deletes the ones it replaces.
+    if PURGE_SCREENSHOTS:
+        kept = pshots(SCREENSHOTS_DIR, NUM_SCREENSHOTS_TO_KEEP)
+        _recent_screenshots.extend(os.path.join(SCREENSHOTS_DIR, f) for f in kept)
+
+    # The HTTP session lives for the whole run so that connections to the
+    # portal are kept alive between checks.
+    session = setup_session()
+    # The WebDriver is only created on the first Selenium fallback and then
+    # reused across checks.
+    pool = DriverPool()
+
+    # Held while a check runs, so that shutting down waits for the running
+    # check before quitting the WebDriver it may still be using.
+    check_lock = threading.Lock()
+
+    def locked_check_job(session, pool):
+        with check_lock:
+            return check_job(session, pool)
+
+    # The scheduler runs the first check right away and then one every
+    # CHECK_INTERVAL_SECONDS, adjusted after each check (see below). Missed
+    # runs (e.g. after the machine slept) are coalesced into one, and a check
+    # never overlaps the previous one.
+    scheduler = BlockingScheduler()
+    job = scheduler.add_job(
+        locked_check_job,
+        "interval",
+        args=(session, pool),
+        seconds=CHECK_INTERVAL_SECONDS,
+        jitter=int(CHECK_INTERVAL_SECONDS * CHECK_INTERVAL_JITTER),
+        next_run_time=datetime.datetime.now(),
+        coalesce=True,
+        max_instances=1,
+        misfire_grace_time=MISFIRE_GRACE_SECONDS,
+    )
+
+    # A check requested (with SIGUSR1, see below) while another one is still
+    # running is skipped by the scheduler because of `max_instances`; remember
+    # it and run it as soon as the running check is done.
+    check_pending = False
+
+    def on_job_skipped(event):
+        nonlocal check_pending
+        check_pending = True
+
+    def run_pending_check():
+        nonlocal check_pending
+        if check_pending:
+            check_pending = False
+            job.modify(next_run_time=datetime.datetime.now())
+            logger.info("Checking again now as requested during the last check.")
+            return True
+        return False
+
+    scheduler.add_listener(on_job_skipped, EVENT_JOB_MAX_INSTANCES)
+
+    # A check that fails unexpectedly is logged (with its traceback) by the
+    # scheduler and reported by email; keep the script running and try again
+    # at the next check.
+    def on_job_error(event):
+        logger.error("Update check failed; trying again at the next check.")
+        _report_job_error(event.exception)
+        run_pending_check()
+
+    scheduler.add_listener(on_job_error, EVENT_JOB_ERROR)
+
+    # Tighten or relax the interval depending on whether the check found an
+    # update, place the next check by the times of day past updates were
+    # found, and add some jitter so checks don't land at predictable times.
+    interval = CHECK_INTERVAL_SECONDS
+
+    def on_job_executed(event):
+        nonlocal interval
+        interval = next_check_interval(interval, event.retval)
+        delay = next_check_delay(interval)
+        job.reschedule(
+            "interval",
+            seconds=delay,
+            jitter=int(delay * CHECK_INTERVAL_JITTER),
+        )
+        if not run_pending_check():
+            logger.info("Next check in about %d min.", delay // 60)
 
-                try:
-                    login(driver, wait)
-
-                except TimeoutException as e:
-                    logging.error(
-                        "!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!"
-                    )
-                    logging.error(
-                        "!!!!!! EXCEPTION: TIMEOUT after trying login() !!!!!!!"
-                    )
-                    logging.error(
-                        "!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!"
-                    )
-                    logging.error(
-                        "SIGN IN FAILED -- TimeoutException -- Either the username or password field was not located after 10 seconds"
-                    )
-                    logging.exception(e)
-                    logging.error(
-                        "!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!"
-                    )
-
-                    screenshot_path = take_screenshot(driver)
-                    send_email(
-                        "IRCC Portal Script Error",
-                        f"SIGN IN FAILED after trying login() -- TimeoutException occurred: {e}",
-                        screenshot_path,
-                    )
-
-                    sys.stdout.flush()  # flush stdout buffer
-                    sys.exit(
-                        "\n\n!!! EXITING SCRIPT DUE TO UNHANDLED EXCEPTION !!!\n !!! TimeoutException in login() !!!\n\n"
-                    )
-
-                except Exception as e:
-                    logging.error(
-                        "!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!"
-                    )
-                    logging.error(
-                        "!!!!!! EXCEPTION: OTHER after trying login() !!!!!!!"
-                    )
-                    logging.error(
-                        "!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!"
-                    )
-                    logging.error("SIGN IN FAILED -- An error occurred")
-                    logging.exception(e)
-                    logging.error(
-                        "!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!"
-                    )
-
-                    screenshot_path = take_screenshot(driver)
-                    send_email(
-                        "IRCC Portal Script Error",
-                        f"SIGN IN FAILED after trying login() -- An error occurred: {e}",
-                        screenshot_path,
-                    )
-
-                    sys.stdout.flush()  # flush stdout buffer
-                    sys.exit(
-                        "\n\n!!! EXITING SCRIPT DUE TO UNHANDLED EXCEPTION !!!\n !!! Exception in login() !!!\n\n"
-                    )
+    scheduler.add_listener(on_job_executed, EVENT_JOB_EXECUTED)
 
-                try:
-                    check_for_updates(driver, wait)
-
-                except TimeoutException as e:
-                    ("!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!")
-                    logging.error(
-                        "!!!!!! EXCEPTION: TIMEOUT after trying login() !!!!!!!"
-                    )
-                    logging.error(
-                        "!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!"
-                    )
-                    logging.error(
-                        "UPDATE CHECK FAILED -- TimeoutException -- The 'Updated' field wasn't located after 10 seconds"
-                    )
-                    logging.exception(e)
-                    logging.error(
-                        "!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!"
-                    )
-
-                    screenshot_path = take_screenshot(driver)
-                    send_email(
-                        "IRCC Portal Script Error",
-                        f"CHECKING FOR UPDATE FAILED after trying check_for_updates() -- TimeoutException occurred: {e}",
-                        screenshot_path,
-                    )
-
-                    sys.stdout.flush()  # flush stdout buffer
-                    sys.exit(
-                        "\n\n!!! EXITING SCRIPT DUE TO UNHANDLED EXCEPTION !!!\n !!! TimeoutException in check_for_updates() !!!\n\n"
-                    )
-
-                except Exception as e:
-                    logging.error(
-                        "!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!"
-                    )
-                    logging.error(
-                        "!!!!!! EXCEPTION: OTHER after trying login() !!!!!!!"
-                    )
-                    logging.error(
-                        "!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!"
-                    )
-                    logging.error("UPDATE CHECK FAILED -- An error occurred")
-                    logging.exception(e)
-                    ("!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!")
-
-                    screenshot_path = take_screenshot(driver)
-                    send_email(
-                        "IRCC Portal Script Error",
-                        f"UPDATE CHECK FAILED after trying check_for_updates() -- An error occurred: {e}",
-                        screenshot_path,
-                    )
-
-                    sys.stdout.flush()  # flush stdout buffer
-                    sys.exit(
-                        "\n\n!!! EXITING SCRIPT DUE TO UNHANDLED EXCEPTION !!!\n !!! Exception in check_for_updates() !!!\n\n"
-                    )
-
-                finally:
-                    # Purge old screenshots if PURGE_SCREENSHOTS is True else do nothing.
-                    pshots(
-                        SCREENSHOTS_DIR, NUM_SCREENSHOTS_TO_KEEP
-                    ) if PURGE_SCREENSHOTS else None
-
-                    i += 1
-
-                    # If REINIT_DRIVER_EVERYTIME is True OR (if it's False AND the reinitialization interval has elapsed), then break out of the inner while loop
-                    current_time = time.time()
-                    if REINIT_DRIVER_EVERYTIME or (
-                        REINITIALIZATION_INTERVAL is not None
-                        and (current_time - start_time) > REINITIALIZATION_INTERVAL
-                    ):
-                        break
-
-                    # # If REINIT_DRIVER_EVERYTIME is True, then close the WebDriver
-                    # if REINIT_DRIVER_EVERYTIME and "driver" in locals():
-                    #     logging.info("---------------------------------------")
-                    #     logging.info(f"----- Closing WebDriver No. {j} -----")
-                    #     logging.info("---------------------------------------")
-                    #     driver.quit()
-                    #     logging.info(f"----- WebDriver No. {j} Closed. -----")
-                    #     j += 1
-
-                    logging.info("=======================================")
-                    logging.info(f"======= ENDING UPDATE CHECK No. {i} =======")
-                    logging.info("=======================================")
-                    logging.info(
-                        f"*zzz* Sleeping for {CHECK_INTERVAL_HOURS} hour(s) before checking again. *zzz*"
-                    )
-                    logging.info("=======================================")
-                    logging.info("=======================================\n\n\n")
-                    sys.stdout.flush()  # flush stdout buffer
-
-                    time.sleep(
-                        CHECK_INTERVAL_SECONDS
-                    )  # sleep for CHECK_INTERVAL_SECONDS seconds
-
-                # End of inner while loop.
-
-            logging.info("---------------------------------------")
-            logging.info(f"----- Closing WebDriver No. {j} -----")
-            logging.info("---------------------------------------")
-            sys.stdout.flush()  # flush stdout buffer
-
-            # End of with block.
-
-        logging.info(f"----- WebDriver No. {j} Closed. -----")
-        j += 1
-
-        logging.info("=======================================")
-        logging.info(f"======= ENDING UPDATE CHECK No. {i} =======")
-        logging.info("=======================================")
-        logging.info(
-            f"*zzz* Sleeping for {CHECK_INTERVAL_HOURS} hour(s) before checking again. *zzz*"
-        )
-        logging.info("=======================================")
-        logging.info("=======================================\n\n\n")
-        sys.stdout.flush()  # flush stdout buffer
+    # `kill -USR1 <PID>` runs a check right away; SIGTERM stops the scheduler
+    # cleanly so the WebDriver is still quit below, once a running check is
+    # done.
+    def on_check_now(signum, frame):
+        logger.info("Received SIGUSR1; checking for updates now.")
+        job.modify(next_run_time=datetime.datetime.now())
 
-        time.sleep(CHECK_INTERVAL_SECONDS)  # sleep for CHECK_INTERVAL_SECONDS seconds
+    def on_terminate(signum, frame):
+        if not scheduler.running:  # A repeated SIGTERM while shutting down
+            return
+        logger.info("Received SIGTERM; stopping the scheduler.")
+        scheduler.shutdown(wait=False)
 
-        # End of outer while loop.
+    if hasattr(signal, "SIGUSR1"):  # Not available on Windows
+        signal.signal(signal.SIGUSR1, on_check_now)
+    signal.signal(signal.SIGTERM, on_terminate)
+
+    try:
+        scheduler.start()
+    finally:
+        with check_lock:  # Let a running check finish first
+            pool.close()
 
 
 if __name__ == "__main__":
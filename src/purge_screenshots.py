@@ -1,7 +1,7 @@
 """
 This module contains a function to purge old screenshots from the screenshots directory.
 
-This function can be called by the main script in check_ircc_updates.py at the end of each update check.
+This function is called by the main script in check_ircc_updates.py once at startup, to clean up screenshots left over from previous runs.
 
 Functions
 ---------
@@ -9,7 +9,9 @@ purge_old_screenshots(dir_path, num_to_keep=10)
     Deletes the oldest screenshots in the specified directory if there are more than num_to_keep files (default 10).
 
 """
+import heapq
 import os
+from operator import itemgetter
 
 
 def purge_old_screenshots(dir_path, num_to_keep=10):
@@ -24,25 +26,32 @@ def purge_old_screenshots(dir_path, num_to_keep=10):
 
     Returns
     -------
-    None
+    kept : list of str
+        The names of the files that were kept, oldest first. Dotfiles such
+        as .gitkeep are never counted, deleted or returned.
 
     Notes
     -----
-    This function should be called by the main script in
-    check_ircc_updates.py at the end of each update check.
+    This function is called by the main script in check_ircc_updates.py
+    once at startup. After that, the main script deletes the screenshots it
+    replaces itself, without scanning the directory.
     """
-    # List all files in the directory along with their timestamps
-    files = [
-        (f, os.path.getmtime(os.path.join(dir_path, f)))
-        for f in os.listdir(dir_path)
-        if os.path.isfile(os.path.join(dir_path, f))
-    ]
-
-    # Sort the files by timestamp, oldest first
-    files.sort(key=lambda x: x[1])
-
-    # If there are more than num_to_keep files, delete the oldest ones.
-    # The -1 is there because we have a .gitkeep file in the screenshots directory.
-    while (len(files)) > num_to_keep:
-        oldest_file = files.pop(0)
-        os.remove(os.path.join(dir_path, oldest_file[0]))
+    # List all files in the directory along with their timestamps. `scandir`
+    # caches each entry's type and stat, so this costs one stat per file. The
+    # screenshots directory's .gitkeep (and any other dotfile) is left alone.
+    with os.scandir(dir_path) as entries:
+        files = [
+            (entry.name, entry.stat().st_mtime)
+            for entry in entries
+            if entry.is_file(follow_symlinks=False) and not entry.name.startswith(".")
+        ]
+
+    # If there are more than num_to_keep files, delete the oldest ones. Only
+    # the files to keep are sorted, rather than the whole directory listing.
+    kept = heapq.nlargest(num_to_keep, files, key=itemgetter(1))
+    kept_names = {f for f, _ in kept}
+    for f, _ in files:
+        if f not in kept_names:
+            os.unlink(os.path.join(dir_path, f))
+
+    return [f for f, _ in reversed(kept)]
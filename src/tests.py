@@ -1,6 +1,22 @@
 import os
 import datetime
-from check_ircc_updates import take_screenshot
+import subprocess
+import time
+import types
+import pytest
+import check_ircc_updates
+from check_ircc_updates import (
+    CHECK_INTERVAL_SECONDS,
+    MAX_CHECK_INTERVAL_SECONDS,
+    MIN_CHECK_INTERVAL_SECONDS,
+    MIN_UPDATE_HISTORY,
+    next_check_delay,
+    next_check_interval,
+    parse_updated_date,
+    read_state,
+    take_screenshot,
+    update_density,
+)
 from purge_screenshots import purge_old_screenshots as pshots
 
 def test_screenshot_and_purge():
@@ -39,5 +55,250 @@ def test_screenshot_and_purge():
         os.remove(filepath)
     os.rmdir(test_dir)
 
+def _history_at(hour, days=20):
+    # Updates found at the same hour on each of the last `days` days
+    found_at = datetime.datetime(2023, 5, 31, hour)
+    return [int((found_at - datetime.timedelta(days=d)).timestamp()) for d in range(days)]
+
+def test_update_density():
+    history = _history_at(10)
+    peak = datetime.datetime(2023, 6, 1, 10)
+    assert update_density(peak, history) > 1
+    assert update_density(peak.replace(hour=22), history) < 0.01
+    # Too few updates to learn from, so every time is equally likely
+    assert update_density(peak, history[: MIN_UPDATE_HISTORY - 1]) == 1.0
+
+def test_next_check_delay_without_history(monkeypatch):
+    monkeypatch.setattr(check_ircc_updates, "_state_cache", {})
+    assert next_check_delay(CHECK_INTERVAL_SECONDS) == CHECK_INTERVAL_SECONDS
+
+def test_next_check_delay_checks_peak_hour(monkeypatch):
+    monkeypatch.setattr(check_ircc_updates, "_state_cache", {"history": _history_at(10)})
+
+    # Simulate three quiet days of checks
+    now = datetime.datetime(2023, 6, 1, 6)
+    interval = CHECK_INTERVAL_SECONDS
+    checks = []
+    while now < datetime.datetime(2023, 6, 4):
+        checks.append(now)
+        interval = next_check_interval(interval, False)
+        now += datetime.timedelta(seconds=next_check_delay(interval, now))
+
+    # Every day, the usual update hour itself gets checked
+    for day in (1, 2, 3):
+        peak = datetime.datetime(2023, 6, day, 10)
+        assert any(abs(check - peak) <= datetime.timedelta(minutes=30) for check in checks)
+
+def test_parse_updated_date():
+    assert parse_updated_date(" May  17,\n2023 ") == int(datetime.datetime(2023, 5, 17).timestamp())
+    # Unexpected formats fall back to the normalized text instead of raising
+    assert parse_updated_date("Updated:  May 17, 2023") == "Updated: May 17, 2023"
+
+def test_next_check_interval():
+    # Halved after an update, 10% longer after each quiet check
+    interval = 4 * MIN_CHECK_INTERVAL_SECONDS
+    assert next_check_interval(interval, True) == interval // 2
+    assert next_check_interval(interval, False) == int(interval * 1.1)
+    # ...but always within the bounds
+    assert next_check_interval(MIN_CHECK_INTERVAL_SECONDS, True) == MIN_CHECK_INTERVAL_SECONDS
+    assert next_check_interval(MAX_CHECK_INTERVAL_SECONDS, False) == MAX_CHECK_INTERVAL_SECONDS
+
+def test_read_state_legacy_formats(monkeypatch, tmp_path):
+    state_file = tmp_path / "last_updated.txt"
+    monkeypatch.setattr(check_ircc_updates, "LAST_UPDATED_FILE", str(state_file))
+    may_17 = int(datetime.datetime(2023, 5, 17).timestamp())
+
+    for contents, expected in [
+        ('{"updated": %d, "etag": "abc"}' % may_17, {"updated": may_17, "etag": "abc"}),
+        ("%d\n" % may_17, {"updated": may_17}),
+        ("May 17, 2023\n", {"updated": may_17}),
+        ("Updated: May 17, 2023\n", {"updated": "Updated: May 17, 2023"}),
+        ("", {}),
+    ]:
+        state_file.write_text(contents)
+        monkeypatch.setattr(check_ircc_updates, "_state_cache", None)
+        assert read_state() == expected
+
+def test_read_state_missing_file(monkeypatch, tmp_path):
+    # A fresh install has no state file yet
+    monkeypatch.setattr(check_ircc_updates, "LAST_UPDATED_FILE", str(tmp_path / "last_updated.txt"))
+    monkeypatch.setattr(check_ircc_updates, "_state_cache", None)
+    assert read_state() == {}
+
+def test_purge_old_screenshots(tmp_path):
+    now = datetime.datetime.now().timestamp()
+    for i in range(4):
+        filepath = tmp_path / f"screenshot_{i}.webp"
+        filepath.write_text("test")
+        os.utime(filepath, (now - i * 60, now - i * 60))
+    (tmp_path / ".gitkeep").write_text("")
+
+    # The newest files are kept and returned oldest first; dotfiles are left alone
+    assert pshots(str(tmp_path), 2) == ["screenshot_1.webp", "screenshot_0.webp"]
+    assert sorted(os.listdir(tmp_path)) == [".gitkeep", "screenshot_0.webp", "screenshot_1.webp"]
+
+def test_kill_driver_processes():
+    # A stand-in for chromedriver that has started a child process (Chrome)
+    process = subprocess.Popen(["sh", "-c", "sleep 60 & wait"])
+    time.sleep(0.5)
+    pids = check_ircc_updates._process_tree(process.pid)
+    assert len(pids) == 2
+
+    driver = types.SimpleNamespace(service=types.SimpleNamespace(process=process))
+    check_ircc_updates._kill_driver_processes(driver)
+    assert driver.service.process is None
+    time.sleep(0.5)
+    # The orphaned child is gone too (reaped by init, or at least a zombie)
+    status = subprocess.run(["ps", "-o", "stat=", "-p", str(pids[1])], capture_output=True, text=True).stdout
+    assert status.strip() in ("", "Z")
+
+def test_report_job_error(monkeypatch):
+    sent = []
+    monkeypatch.setattr(check_ircc_updates, "send_email", lambda subject, body: sent.append(body))
+    monkeypatch.setattr(check_ircc_updates, "_last_error_email", (None, None))
+    now = datetime.datetime(2023, 6, 1, 10)
+
+    check_ircc_updates._report_job_error(FileNotFoundError("last_updated.txt"), now)
+    # The same error on the next checks isn't emailed again for a while...
+    check_ircc_updates._report_job_error(FileNotFoundError("last_updated.txt"), now + datetime.timedelta(hours=1))
+    assert len(sent) == 1
+    # ...but a different one is
+    check_ircc_updates._report_job_error(OSError("disk full"), now + datetime.timedelta(hours=2))
+    assert len(sent) == 2
+    check_ircc_updates._report_job_error(OSError("disk full"), now + datetime.timedelta(days=1, hours=2))
+    assert len(sent) == 3
+
+def test_read_login_form():
+    page = """
+    <form action="/search"><input type="hidden" name="q" value="x"></form>
+    <form method="post" action='/en/login?step=1&amp;x=2'>
+      <input value="t&amp;1" name="__RequestToken" type="hidden">
+      <input type=hidden name=lang value=en>
+      <input id="uci" name="Input.Uci" type="text">
+      <input type="password" id="password" name="Input.Password">
+      <input type="checkbox" name="remember" value="on">
+    </form>
+    """
+    post_url, data = check_ircc_updates._read_login_form(page, "https://portal.example/en/signin")
+    assert post_url == "https://portal.example/en/login?step=1&x=2"
+    assert data == {
+        "__RequestToken": "t&1",
+        "lang": "en",
+        "Input.Uci": check_ircc_updates.USERNAME_IRCC,
+        "Input.Password": check_ircc_updates.PASSWORD_IRCC,
+    }
+    # Without the credential fields nothing is posted
+    with pytest.raises(check_ircc_updates.HTTPCheckError):
+        check_ircc_updates._read_login_form('<form><input id="uci"></form>', "https://portal.example/")
+
+class FakeSession:
+    # Answers the dashboard requests of check_for_updates_http with canned responses
+    def __init__(self, head_status=200, get_status=200, page="", headers=None):
+        self.head_status = head_status
+        self.get_status = get_status
+        self.page = page
+        self.headers = headers or {}
+        self.requests = []
+
+    def _response(self, status_code, text="", headers=None):
+        return types.SimpleNamespace(
+            status_code=status_code,
+            text=text,
+            headers=headers or {},
+            url=check_ircc_updates.DASHBOARD_URL,
+            raise_for_status=lambda: None,
+        )
+
+    def head(self, url, headers=None, **kwargs):
+        self.requests.append(("HEAD", headers))
+        return self._response(self.head_status)
+
+    def get(self, url, headers=None, **kwargs):
+        self.requests.append(("GET", headers))
+        return self._response(self.get_status, self.page, self.headers)
+
+    def post(self, url, **kwargs):
+        raise AssertionError("The session shouldn't need to sign in")
+
+def _dashboard(date, token):
+    # The dashboard HTML, with per-request tokens that mustn't affect its hash
+    return (
+        f"<html><script>var token = '{token}';</script>"
+        f'<input type="hidden" name="token" value="{token}">'
+        f'<p>Updated: <span class="date-text">{date}</span></p></html>'
+    )
+
+def _http_check_state(monkeypatch, tmp_path, state):
+    monkeypatch.setattr(check_ircc_updates, "LAST_UPDATED_FILE", str(tmp_path / "last_updated.txt"))
+    monkeypatch.setattr(check_ircc_updates, "_state_cache", state)
+    monkeypatch.setattr(check_ircc_updates, "HEARTBEAT_HOUR", None)
+    sent = []
+    monkeypatch.setattr(
+        check_ircc_updates,
+        "send_notification",
+        lambda updated_date, update, screenshot_path, now=None: sent.append((updated_date, update)),
+    )
+    return sent
+
+def test_http_check_head_304(monkeypatch, tmp_path):
+    may_17 = int(datetime.datetime(2023, 5, 17).timestamp())
+    sent = _http_check_state(monkeypatch, tmp_path, {"updated": may_17, "etag": '"v1"'})
+    session = FakeSession(head_status=304)
+
+    assert check_ircc_updates.check_for_updates_http(session) is False
+    # The dashboard itself isn't fetched
+    assert session.requests == [("HEAD", {"If-None-Match": '"v1"'})]
+    assert sent == []
+
+def test_http_check_get_304(monkeypatch, tmp_path):
+    may_17 = int(datetime.datetime(2023, 5, 17).timestamp())
+    state = {"updated": may_17, "last_modified": "Wed, 17 May 2023 10:00:00 GMT"}
+    sent = _http_check_state(monkeypatch, tmp_path, dict(state))
+    session = FakeSession(get_status=304)
+
+    assert check_ircc_updates.check_for_updates_http(session) is False
+    assert [method for method, _ in session.requests] == ["HEAD", "GET"]
+    assert session.requests[1][1] == {"If-Modified-Since": state["last_modified"]}
+    assert read_state() == state
+    assert sent == []
+
+def test_http_check_saves_version_and_skips_unchanged_page(monkeypatch, tmp_path):
+    may_17 = int(datetime.datetime(2023, 5, 17).timestamp())
+    sent = _http_check_state(monkeypatch, tmp_path, {"updated": may_17})
+    headers = {"ETag": '"v2"', "Last-Modified": "Thu, 01 Jun 2023 10:00:00 GMT"}
+
+    # A new date is an update, and the page's version is saved with it
+    session = FakeSession(page=_dashboard("June 1, 2023", "a1"), headers=headers)
+    assert check_ircc_updates.check_for_updates_http(session) is True
+    assert sent == [("June 1, 2023", True)]
+    state = read_state()
+    assert state["updated"] == int(datetime.datetime(2023, 6, 1).timestamp())
+    assert state["updated_text"] == "June 1, 2023"
+    assert state["etag"] == '"v2"'
+    assert state["last_modified"] == headers["Last-Modified"]
+    assert state["page_hash"]
+    # ...and sent back with the next check's requests
+    assert check_ircc_updates._conditional_headers() == {
+        "If-None-Match": '"v2"',
+        "If-Modified-Since": headers["Last-Modified"],
+    }
+
+    # The same page with fresh tokens has the same hash, so it isn't parsed
+    monkeypatch.setattr(check_ircc_updates, "handle_updated_date", None)
+    session = FakeSession(page=_dashboard("June 1, 2023", "b2"), headers=headers)
+    assert check_ircc_updates.check_for_updates_http(session) is False
+    assert read_state() == state
+    assert len(sent) == 1
+
+def test_heartbeat_quotes_date_as_shown(monkeypatch, tmp_path):
+    june_1 = int(datetime.datetime(2023, 6, 1).timestamp())
+    sent = _http_check_state(monkeypatch, tmp_path, {"updated": june_1, "updated_text": "June 1, 2023"})
+    monkeypatch.setattr(check_ircc_updates, "HEARTBEAT_HOUR", 9)
+    check_ircc_updates._report_unchanged(datetime.datetime(2023, 6, 5, 10))
+    # States saved before the text was kept don't get a zero-padded day either
+    monkeypatch.setattr(check_ircc_updates, "_state_cache", {"updated": june_1})
+    check_ircc_updates._report_unchanged(datetime.datetime(2023, 6, 6, 10))
+    assert sent == [("June 1, 2023", False), ("June 1, 2023", False)]
+
 if __name__ == "__main__":
     test_screenshot_and_purge()
\ No newline at end of file